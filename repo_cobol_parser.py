@@ -4,53 +4,175 @@ Repo‑wide COBOL structure & call‑graph extractor (function‑style)
 ================================================================
 * Recurses through **all** `.cbl` files in a folder tree.
 * Writes one JSON file per source and a repo‑level `filecall_graph.json`.
+* Re‑runs only re‑parse sources whose mtime/size changed (`<out_dir>/.cache.json`).
+* Lines break where `str.splitlines()` would (`\n`, `\r\n`, lone `\r`,
+  VT/FF, FS/GS/RS, NEL, LS/PS).
+* Names are matched as ASCII: an identifier holding a non‑ASCII character
+  (e.g. `CAFÉ`) is not recognised – skipped, never truncated.
 * Designed to be invoked **programmatically** via `main()` instead of a CLI.
+  Larger runs parse in worker processes, so on spawn‑start platforms
+  (macOS, Windows) call `main()` from under `if __name__ == "__main__":`.
 
 Example
 -------
 ```python
 import repo_cobol_parser  # this file
-repo_cobol_parser.main(
-    repo_root="/path/to/repo",           # defaults to current dir
-    out_dir="cobol_structures",          # per‑file structures
-    callgraph="filecall_graph.json"      # aggregated edges
-)
+
+if __name__ == "__main__":
+    repo_cobol_parser.main(
+        repo_root="/path/to/repo",           # defaults to current dir
+        out_dir="cobol_structures",          # per‑file structures
+        callgraph="filecall_graph.json"      # aggregated edges
+    )
 ```
 
-Dependencies: only the standard library.
+Dependencies: only the standard library (`orjson` is used for writing JSON
+when installed).
 """
 
 from __future__ import annotations
 
-import json, pathlib, re, sys
-from collections import defaultdict
+import json, mmap, os, pathlib, re, sys
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, List, Optional
 
+try:  # optional – much faster JSON encoding, writes bytes directly
+    import orjson
+
+    def _encode(obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:  # e.g. surrogate‑escaped (non‑UTF‑8) file names
+            return json.dumps(obj, indent=2).encode()
+except ImportError:
+    def _encode(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+def _dump_array(rows, path: pathlib.Path):
+    """Stream JSON objects to path as an indented array – same bytes as
+    dumping the whole list with indent=2, but only one row is held at a time"""
+    with open(path, "wb") as fp:
+        sep = b"[\n  "
+        for row in rows:
+            fp.write(sep)
+            fp.write(_encode(row).replace(b"\n", b"\n  "))  # JSON strings never hold raw newlines
+            sep = b",\n  "
+        fp.write(b"[]" if sep == b"[\n  " else b"\n]")
+
+# ---------------------------------------------------------------------------
+# Source access – sources are scanned as raw bytes through a read‑only mmap
+# (no full‑file decode; only captured names are decoded to str)
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def _mapped(path: str | pathlib.Path):
+    """Yield a read‑only mmap of path (b"" for empty files, which mmap rejects)"""
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
 # ---------------------------------------------------------------------------
 # Quick PROGRAM‑ID sniff (for call resolution)
 # ---------------------------------------------------------------------------
-_PROGID_RE = re.compile(r"^\s*PROGRAM-ID\.\s+([\w-]+)\.", re.I | re.M)
+# A line may also start after a lone \r, as it did on text read with
+# universal newlines.
+_PROGID_RE = re.compile(rb"(?:^|(?<=\r))\s*PROGRAM-ID\.\s+([\w-]+)\.", re.I | re.M)
 
 
-def sniff_program_id(path: pathlib.Path) -> Optional[str]:
+def sniff_program_id(path: str | pathlib.Path) -> Optional[str]:
     """Return PROGRAM‑ID for a file or None if not found/accessible"""
     try:
-        text = path.read_text(errors="ignore")
+        with _mapped(path) as buf:
+            m = _PROGID_RE.search(buf)
+            return m[1].decode("ascii") if m else None
     except Exception:
         return None
-    m = _PROGID_RE.search(text)
-    return m[1] if m else None
 
 # ---------------------------------------------------------------------------
 # COBOL file parser (regex heuristics)
 # ---------------------------------------------------------------------------
-_DIV_RE   = re.compile(r"^\s*(\w[\w-]*)\s+DIVISION\b", re.I)
-_SEC_RE   = re.compile(r"^\s*(\w[\w-]*)\s+SECTION\.",  re.I)
-_VAR_RE   = re.compile(r"^\s*(\d{2})\s+([\w-]+).*?\bPIC\b\s+([A-Za-z0-9()V-]+)", re.I)
-_PAR_RE   = re.compile(r"^\s*([\w-]+)\.\s*$", re.I)
-_CALL_RE  = re.compile(r"\bCALL\s+\"?([\w-]+)\"?", re.I)
-_PERF_RE  = re.compile(r"\bPERFORM\s+([\w-]+)", re.I)
-_COMMENT  = ("*", "*>")  # traditional + free‑format comments
+# Multiline patterns scanned over the whole file with ``finditer``, so the
+# line loop runs inside the C regex engine.  Every alternative is anchored at
+# a line start and consumes the rest of its line.  ``[^\S\n]`` is
+# "whitespace except newline" so nothing spans lines.  Patterns are bytes
+# patterns, so \w, \s, \b and case folding are ASCII‑only and every
+# captured name decodes as ASCII.  Names that could otherwise stop short
+# at a non‑ASCII byte (PIC item names, CALL / PERFORM targets) are guarded
+# by ``_ASCII_NAME``, so such a name is skipped rather than truncated; the
+# others must be followed by "." or whitespace and fail on their own.
+#
+# DIVISION / SECTION headers and paragraph names all start with one word, so
+# that word is scanned once and the line shape after it picks the kind via
+# an empty marker group: "<word>." alone is a paragraph, "<word> DIVISION" /
+# "<word> SECTION." a header.  Anything else fails right after the first
+# word; PIC items fail on their first character unless it is a digit.  A
+# header word must start with a word character, a paragraph name may also
+# start with "-" (``dpara``).
+_ASCII_NAME = rb"(?![\w-]*[\x80-\xff])"
+_ANCHORS  = (
+    rb"(?P<word>\w[\w-]*)(?:\.[^\S\n]*$(?P<para>)"
+    rb"|[^\S\n]+(?:DIVISION\b(?P<div>)|SECTION\.(?P<sec>))[^\n]*)",
+    rb"PROGRAM-ID\.[^\S\n]+(?P<pid>[\w-]+)\.[^\n]*",
+    rb"(?P<var>(?P<lvl>\d{2})[^\S\n]+" + _ASCII_NAME + rb"(?P<name>[\w-]+).*?\bPIC\b[^\S\n]+(?P<pic>[A-Za-z0-9()V-]+))[^\n]*",
+)
+# Outside the PROCEDURE division only structural lines matter; everything
+# else is skipped by the engine and never reaches Python.  Paragraph‑shaped
+# lines still match there – a bare "PROGRAM-ID." line may have its name on
+# the next line – and are otherwise ignored.
+_HEAD_RE  = re.compile(rb"^[^\S\n]*(?:" + b"|".join(_ANCHORS) + b")", re.I | re.M)
+# PROCEDURE division – adds comments, "-"‑led paragraphs and any other
+# non-blank line (``code``) as candidates for CALL / PERFORM.
+_SCAN_RE  = re.compile(
+    rb"^[^\S\n]*(?:\*[^\n]*|" + b"|".join(_ANCHORS) +
+    rb"|(?P<dpara>-[\w-]*)\.[^\S\n]*$"
+    rb"|(?P<code>\S[^\n]*))",
+    re.I | re.M,
+)
+# Group numbers for dispatch on ``m.lastindex`` (a plain int on the match)
+# and positional group access.  _HEAD_RE starts with the same alternatives,
+# so its numbering is identical.
+(_WORD, _PARA, _DIV, _SEC, _PID, _VAR, _LVL, _NAME, _PIC, _DPARA) = (
+    _SCAN_RE.groupindex[g]
+    for g in ("word", "para", "div", "sec", "pid", "var", "lvl", "name", "pic", "dpara")
+)
+# CALL / PERFORM sites inside a procedure line – zero‑width alternatives, so
+# one site never swallows another (``CALL PERFORM A`` holds both); group 1 =
+# CALL target, group 2 = PERFORM target
+_STMT_RE  = re.compile(
+    rb"\b(?=CALL\s+\"?" + _ASCII_NAME + rb"(?P<call>[\w-]+)|PERFORM\s+" + _ASCII_NAME + rb"(?P<perf>[\w-]+))",
+    re.I,
+)
+
+# Line breaks other than \n / \r\n that str.splitlines() also honours (lone
+# CR, VT, FF, FS/GS/RS and NEL, LS, PS in UTF‑8).  They are rare, so plain
+# substring searches decide whether a file needs rejoining on \n before the
+# scan; a CR only counts once _LONE_CR_RE finds one outside \r\n.
+_ODD_EOLS = (b"\x0b", b"\x0c", b"\x1c", b"\x1d", b"\x1e", b"\xc2\x85", b"\xe2\x80\xa8", b"\xe2\x80\xa9")
+_LONE_CR_RE = re.compile(rb"\r(?!\n)")
+
+
+def _odd_eols(buf: bytes | mmap.mmap) -> bool:
+    # find() rather than ``in`` – mmap's ``in`` only tests single bytes
+    if any(buf.find(eol) >= 0 for eol in _ODD_EOLS):
+        return True
+    return buf.find(b"\r") >= 0 and _LONE_CR_RE.search(buf) is not None
+
+# DIVISION / SECTION names repeat across every file; memoize their
+# upper‑cased, decoded form and intern it so comparisons hit the identity
+# fast path.
+_upper_cache: dict[bytes, str] = {}
+
+
+def _up(raw: bytes, _c=_upper_cache) -> str:
+    u = _c.get(raw)
+    if u is None:
+        u = _c[raw] = sys.intern(raw.upper().decode("ascii"))
+    return u
 
 
 class CobolParser:
@@ -59,64 +181,118 @@ class CobolParser:
     def __init__(self, path: pathlib.Path):
         self.path = path
         self.program_id: str = path.stem
+        self.index_id: Optional[str] = None  # PROGRAM‑ID the repo index files this source under
         self.divisions: list[str] = []
-        self.data_sections: dict[str, list[dict]] = defaultdict(list)
+        self.data_sections: dict[str, list[dict]] = {}
         self.paragraphs: dict[str, dict] = {}
-        self.calls: list[dict] = []  # populated during parse()
+        # CALL sites as flat tuples – only pass 2 reads them, so no row
+        # dict is built per site (from_file is implied by the path)
+        self.calls: list[tuple[str, int, str]] = []  # (from_paragraph, line, to_program)
 
     # ---------------------------------------------------------
     def parse(self):
+        with _mapped(self.path) as buf:
+            if not _odd_eols(buf):
+                self._scan(buf)
+                return
+            # rare – scan a decoded copy rejoined on \n, but index the
+            # PROGRAM‑ID as sniff_program_id would, on the bytes as read
+            self._scan("\n".join(buf[:].decode("utf-8", "ignore").splitlines()).encode())
+            m = _PROGID_RE.search(buf)
+            self.index_id = m[1].decode("ascii") if m else None
+
+    def _scan(self, text: bytes | mmap.mmap):
         div = sec = para = None
-        for lineno, raw in enumerate(self.path.read_text(errors="ignore").splitlines(), 1):
-            if raw.lstrip().startswith(_COMMENT):
-                continue
-            strip = raw.rstrip().strip()
-            if not strip:
-                continue
-
-            # DIVISION, SECTION, PROGRAM‑ID
-            if m := _DIV_RE.match(strip):
-                div, sec, para = m[1].upper(), None, None
-                if div not in self.divisions:
-                    self.divisions.append(div)
-                continue
-            if m := _SEC_RE.match(strip):
-                sec = m[1].upper()
-                continue
-            if m := _PROGID_RE.match(strip):
-                self.program_id = m[1]
-                continue
-
-            # DATA items
-            if div == "DATA" and sec and (m := _VAR_RE.match(strip)):
-                self.data_sections[sec].append(
-                    dict(level=int(m[1]), name=m[2], pic=m[3])
-                )
-                continue
-
-            # PROCEDURE division
-            if div == "PROCEDURE":
-                if m := _PAR_RE.match(strip):
-                    para = m[1]
-                    self.paragraphs[para] = dict(statements=[])
+        sec_items = stmts = None    # rows of the current section / paragraph
+        pos, lineno = 0, 1          # running newline cursor for line numbers
+        # hot‑loop lookups bound once
+        stmt_iter = _STMT_RE.finditer
+        add_call = self.calls.append
+        # The scanner is swapped whenever a DIVISION header changes whether
+        # we are in PROCEDURE; scanning then resumes right after the header.
+        scanner, resume = _HEAD_RE, 0
+        while scanner:
+            for m in scanner.finditer(text, resume):
+                kind = m.lastindex
+                if kind is None:        # comment line (traditional or free‑format)
+                    continue
+
+                # DIVISION, SECTION, PROGRAM‑ID
+                if kind == _DIV:
+                    div, sec, para = _up(m[_WORD]), None, None
+                    sec_items = None
+                    if div not in self.divisions:
+                        self.divisions.append(div)
+                    nxt = _SCAN_RE if div == "PROCEDURE" else _HEAD_RE
+                    if nxt is not scanner:
+                        scanner, resume = nxt, m.end()
+                        break
+                    continue
+                if kind == _SEC:
+                    sec = _up(m[_WORD])
+                    sec_items = None
+                    continue
+                if kind == _PID:
+                    self.program_id = m[_PID].decode("ascii")
+                    if self.index_id is None:
+                        self.index_id = self.program_id
+                    continue
+                if kind == _PARA and self.index_id is None and m[_WORD].upper() == b"PROGRAM-ID":
+                    # name on a following line – indexed (as sniff_program_id
+                    # does) but, as before, not the structure's program_id
+                    if pm := _PROGID_RE.match(text, m.start()):
+                        self.index_id = pm[1].decode("ascii")
+
+                # DATA items
+                if kind == _VAR and div == "DATA" and sec:
+                    if sec_items is None:   # first item – sections without items stay absent
+                        sec_items = self.data_sections.setdefault(sec, [])
+                    sec_items.append(
+                        dict(level=int(m[_LVL]), name=m[_NAME].decode("ascii"), pic=m[_PIC].decode("ascii"))
+                    )
+                    continue
+
+                # PROCEDURE division
+                if div != "PROCEDURE":
+                    continue
+                if kind == _PARA or kind == _DPARA:
+                    para = m[_WORD if kind == _PARA else _DPARA].decode("ascii")
+                    stmts = []
+                    self.paragraphs[para] = dict(statements=stmts)
                     continue
                 if para is None:
                     continue
 
-                # CALL / PERFORM detection
-                if m := _CALL_RE.search(strip):
-                    tgt = m[1]
-                    self.paragraphs[para]["statements"].append(
-                        dict(type="CALL", target=tgt, line=lineno)
-                    )
-                    self.calls.append(
-                        dict(from_file=str(self.path), from_paragraph=para, line=lineno, to_program=tgt)
+                # CALL / PERFORM detection – first of each kind per line; a
+                # plain substring test rules out most lines before any regex
+                line = m[0]
+                upper = line.upper()
+                if b"CALL" not in upper and b"PERFORM" not in upper:
+                    continue
+                call = perf = None
+                for sm in stmt_iter(line):
+                    if sm.lastindex == 1:
+                        call = call or sm[1].decode("ascii")
+                    else:
+                        perf = perf or sm[2].decode("ascii")
+                if not (call or perf):
+                    continue
+                # line number only for lines that emit a statement; the
+                # cursor only moves forward, so all counting is O(file size)
+                start = m.start()
+                lineno += text[pos:start].count(b"\n")
+                pos = start
+                if call:
+                    stmts.append(
+                        dict(type="CALL", target=call, line=lineno)
                     )
-                if m := _PERF_RE.search(strip):
-                    tgt = m[1]
-                    self.paragraphs[para]["statements"].append(
-                        dict(type="PERFORM", target=tgt, line=lineno)
+                    add_call((para, lineno, call))
+                if perf:
+                    stmts.append(
+                        dict(type="PERFORM", target=perf, line=lineno)
                     )
+            else:
+                scanner = None      # reached end of text
 
     # ---------------------------------------------------------
     def to_dict(self):
@@ -128,13 +304,38 @@ class CobolParser:
             paragraphs=self.paragraphs,
         )
 
+
+def _parse_one(path: str) -> tuple[dict, list[tuple], Optional[str]]:
+    """Worker entry – parse one file, return its structure, CALL sites
+    and the PROGRAM‑ID it is indexed under (the first one, if any)"""
+    parser = CobolParser(pathlib.Path(path))
+    parser.parse()
+    return parser.to_dict(), parser.calls, parser.index_id
+
 # ---------------------------------------------------------------------------
-# Index builder – map PROGRAM‑ID → source path for the whole repo
+# Source discovery + index builder – map PROGRAM‑ID → source path
 # ---------------------------------------------------------------------------
 
-def build_index(root: pathlib.Path) -> Dict[str, pathlib.Path]:
-    idx: Dict[str, pathlib.Path] = {}
-    for f in root.rglob("*.cbl"):
+def iter_cbl(root: str):
+    """Yield path strings of all `.cbl` files below root (os.scandir walk,
+    no Path object per entry).  Same order as rglob: a directory's files in
+    scandir order, then its subdirectories pre‑order; symlinked dirs are not
+    followed."""
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    subdirs.append(e.path)
+                elif e.name.endswith(".cbl"):
+                    yield e.path
+        stack.extend(reversed(subdirs))     # first subdir is popped next
+
+
+def build_index(root: pathlib.Path) -> Dict[str, str]:
+    idx: Dict[str, str] = {}
+    for f in iter_cbl(str(root)):
         if pid := sniff_program_id(f):
             idx[pid.lower()] = f
     return idx
@@ -142,37 +343,114 @@ def build_index(root: pathlib.Path) -> Dict[str, pathlib.Path]:
 # ---------------------------------------------------------------------------
 # Repo‑level processor
 # ---------------------------------------------------------------------------
+_EDGE_KEYS = ("from_file", "from_paragraph", "line", "to_program", "to_file")
+
+# Incremental runs: ``<out_dir>/.cache.json`` maps each source path to the
+# (mtime_ns, size) it had when last parsed plus what pass 2 needs from it
+# (indexed PROGRAM‑ID and CALL sites).  An unchanged source whose structure
+# JSON still exists is neither re‑read nor re‑written.  Bump the version
+# whenever parser output changes so stale entries are discarded.
+_CACHE_NAME = ".cache.json"
+_CACHE_VERSION = 1
+
+# Below this many changed files, parse in‑process: spawning the worker pool
+# costs more than it saves on small (typically incremental) runs.
+_POOL_MIN_FILES = 32
+
+
+def _load_cache(path: pathlib.Path) -> Dict[str, dict]:
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    if not isinstance(files, dict):
+        return {}
+    # Malformed entries are dropped here, i.e. treated as cache misses
+    return {f: e for f, e in files.items() if _valid_entry(e)}
+
+
+def _valid_entry(e) -> bool:
+    return (
+        isinstance(e, dict)
+        and isinstance(e.get("stat"), list)
+        and isinstance(e.get("program_id", 0), (str, type(None)))
+        and isinstance(e.get("calls"), list)
+        and all(isinstance(c, list) and len(c) == 3 and isinstance(c[2], str) for c in e["calls"])
+    )
+
+
+def _save_cache(path: pathlib.Path, entries: Dict[str, dict]):
+    """Write the cache atomically (temp file + rename)"""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(json.dumps(dict(version=_CACHE_VERSION, files=entries)).encode())
+    os.replace(tmp, path)
+
 
 def parse_repo(repo_root: pathlib.Path, out_dir: pathlib.Path, callgraph_file: pathlib.Path):
-    """Parse every COBOL file once, emit per‑file JSON + global call graph."""
+    """Parse every changed COBOL file once, emit per‑file JSON + global call graph."""
 
     out_dir.mkdir(parents=True, exist_ok=True)
-    program_index = build_index(repo_root)
-
-    # Pass 1 – parse every COBOL file
-    structures: Dict[pathlib.Path, CobolParser] = {}
-    for file in repo_root.rglob("*.cbl"):
-        parser = CobolParser(file)
-        parser.parse()
-        structures[file] = parser
-
-    # Pass 2 – resolve CALL edges to files (if known)
-    all_edges: List[dict] = []
-    for parser in structures.values():
-        for edge in parser.calls:
-            tgt_prog = edge["to_program"].lower()
-            edge["to_file"] = str(program_index.get(tgt_prog)) if tgt_prog in program_index else None
-            all_edges.append(edge)
-
-    # Emit one JSON per COBOL file – directory layout mirrored
-    for file, parser in structures.items():
-        dst = (out_dir / file.relative_to(repo_root)).with_suffix(".structure.json")
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        dst.write_text(json.dumps(parser.to_dict(), indent=2))
-
-    # Emit aggregated call‑graph
-    callgraph_file.write_text(json.dumps(all_edges, indent=2))
-    print(f"✔ Parsed {len(structures)} COBOL program(s).")
+    cache_file = out_dir / _CACHE_NAME
+    cache = _load_cache(cache_file)
+
+    # Split sources into cache hits and files that need parsing
+    files = list(iter_cbl(str(repo_root)))
+    dsts: Dict[str, pathlib.Path] = {}
+    entries: Dict[str, dict] = {}   # rebuilt each run – deleted sources drop out
+    todo: List[str] = []
+    for file in files:
+        st = os.stat(file)
+        stamp = [st.st_mtime_ns, st.st_size]
+        dsts[file] = dst = (out_dir / os.path.relpath(file, repo_root)).with_suffix(".structure.json")
+        hit = cache.get(file)
+        if hit and hit["stat"] == stamp and dst.exists():
+            entries[file] = hit
+        else:
+            entries[file] = dict(stat=stamp)
+            todo.append(file)
+
+    # Pass 1 – parse changed COBOL files across worker processes (only path
+    # strings go in, plain dicts/lists come back).  Each file is read once;
+    # the PROGRAM‑ID index is built from the parse (or cached) results.
+    structures: Dict[str, dict] = {}
+    with ProcessPoolExecutor() if len(todo) >= _POOL_MIN_FILES else nullcontext() as ex:
+        results = ex.map(_parse_one, todo, chunksize=8) if ex else map(_parse_one, todo)
+        for file, (struct, calls, pid) in zip(todo, results):
+            structures[file] = struct
+            entries[file].update(program_id=pid, calls=calls)
+    program_index: Dict[str, str] = {}
+    for file in files:
+        if pid := entries[file]["program_id"]:
+            program_index[pid.lower()] = file
+
+    # Emit one JSON per parsed COBOL file – directory layout mirrored.
+    # Encoding stays on this thread; the writes are overlapped on a small
+    # thread pool and each output directory is created once.
+    made_dirs: set[pathlib.Path] = set()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pending = []
+        for file, struct in structures.items():
+            dst = dsts[file]
+            if dst.parent not in made_dirs:
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(dst.parent)
+            pending.append(pool.submit(dst.write_bytes, _encode(struct)))
+        for fut in pending:
+            fut.result()    # surface write errors
+    _save_cache(cache_file, entries)
+
+    # Pass 2 – resolve CALL edges to files (if known) and stream them out;
+    # each edge dict lives only while it is being encoded
+    edges = (
+        dict(zip(_EDGE_KEYS, (file, para, line, tgt, program_index.get(tgt.lower()))))
+        for file in files
+        for para, line, tgt in entries[file]["calls"]
+    )
+    _dump_array(edges, callgraph_file)
+    print(f"✔ Parsed {len(structures)} COBOL program(s), {len(files) - len(structures)} unchanged.")
     print(f"  • Structures  → {out_dir}/<file>.structure.json (mirrors repo layout)")
     print(f"  • Call‑graph  → {callgraph_file}")
 